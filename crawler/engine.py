@@ -1,6 +1,7 @@
 import os
 import json
 import time
+import orjson
 import random
 import logging
 import warnings
@@ -90,8 +91,8 @@ class RecursiveBlogDiscovery:
                     logger.info("No checkpoint file found, starting fresh")
                 return False
                 
-            with open(checkpoint_path, 'r') as f:
-                checkpoint_data = json.load(f)
+            with open(checkpoint_path, 'rb') as f:
+                checkpoint_data = orjson.loads(f.read())
             
             # Validate and load into state object
             self.state = DiscoveryState.model_validate(checkpoint_data)
@@ -60,9 +60,9 @@ def archive_old_results() -> int:
             # Try to get blog count from JSON
             count_suffix = ""
             try:
-                import json
-                with open(source_path, 'r') as f:
-                    data = json.load(f)
+                import orjson
+                with open(source_path, 'rb') as f:
+                    data = orjson.loads(f.read())
                     if 'discovered_blogs' in data:
                         count = len(data['discovered_blogs'])
                         count_suffix = f"_{count}"
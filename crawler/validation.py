@@ -1,7 +1,8 @@
+import re
 import logging
 import requests
 import urllib.robotparser
-from urllib.parse import urlparse, urljoin
+from urllib.parse import urlparse
 from typing import Dict
 
 from config import Settings
@@ -11,6 +12,18 @@ from .utils import extract_domain
 settings = Settings()
 logger = logging.getLogger(__name__)
 
+# Precompiled lookups so each URL is checked in one pass instead of per-entry loops
+_DANGEROUS_EXTENSIONS = frozenset(settings.DANGEROUS_EXTENSIONS)
+_SUSPICIOUS_RE = re.compile('|'.join(map(re.escape, [
+    'exec', 'setup',
+    '/bin/', '/sbin/', '/usr/bin/',
+    'malware', 'virus', 'exploit', 'hack',
+    'phishing', 'scam', 'fraud'
+])))
+# Allowed when the URL looks like a blog path (e.g. "how-to-install-python")
+_SOFT_SUSPICIOUS_RE = re.compile('download|install')
+_BLOG_PATH_RE = re.compile('blog|post|article')
+
 def is_safe_url(url: str) -> bool:
     """Check if URL is safe (no dangerous extensions or suspicious patterns)"""
     try:
@@ -19,26 +32,21 @@ def is_safe_url(url: str) -> bool:
         path = parsed.path
         
         # Check for dangerous file extensions
-        for ext in settings.DANGEROUS_EXTENSIONS:
-            if path.endswith(ext):
+        if '.' in path:
+            ext = '.' + path.rsplit('.', 1)[1]
+            if ext in _DANGEROUS_EXTENSIONS:
                 logger.warning(f"Blocked dangerous URL: {url} (extension: {ext})")
                 return False
         
         # Check for suspicious patterns
-        suspicious_patterns = [
-            'download', 'exec', 'install', 'setup',
-            '/bin/', '/sbin/', '/usr/bin/',
-            'malware', 'virus', 'exploit', 'hack',
-            'phishing', 'scam', 'fraud'
-        ]
-        
-        for pattern in suspicious_patterns:
-            if pattern in url_lower:
-                # Allow common blog paths that might contain these words
-                if pattern in ['download', 'install'] and any(blog_word in url_lower for blog_word in ['blog', 'post', 'article']):
-                    continue
-                logger.warning(f"Blocked suspicious URL: {url} (pattern: {pattern})")
-                return False
+        match = _SUSPICIOUS_RE.search(url_lower)
+        if not match:
+            match = _SOFT_SUSPICIOUS_RE.search(url_lower)
+            if match and _BLOG_PATH_RE.search(url_lower):
+                match = None
+        if match:
+            logger.warning(f"Blocked suspicious URL: {url} (pattern: {match.group()})")
+            return False
         
         return True
     except:
@@ -90,13 +98,10 @@ class Validator:
             if not domain:
                 return True
                 
-            base_url = f"https://{domain}"
-            robots_url = urljoin(base_url, '/robots.txt')
-            
-            # Check cache
-            if domain in self.robots_cache:
-                rp = self.robots_cache[domain]
-            else:
+            # Check cache before building the robots.txt URL or touching the network
+            rp = self.robots_cache.get(domain)
+            if rp is None:
+                robots_url = f"https://{domain}/robots.txt"
                 rp = urllib.robotparser.RobotFileParser()
                 rp.set_url(robots_url)
                 try:
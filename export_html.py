@@ -3,8 +3,7 @@
 Export the Blog Discovery Viewer to a static HTML file for GitHub Pages.
 """
 
-from flask import Flask, render_template_string
-from view import COMBINED_TEMPLATE, load_data
+from view import load_data, render_page
 import os
 
 def export():
@@ -16,11 +15,9 @@ def export():
     data = load_data()
     print(f"Loaded {data['total_blogs']} blogs")
     
-    # Create a dummy Flask app context to render the template
-    app = Flask(__name__)
-    with app.app_context():
-        # Render the template with the data
-        html_content = render_template_string(COMBINED_TEMPLATE, **data)
+    # Standalone inlines the CSS and graph data, since GitHub Pages only gets
+    # this one file and has no /data.json to fetch from
+    html_content = render_page(data, standalone=True)
     
     # Save to index.html
     output_file = 'index.html'
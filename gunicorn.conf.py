@@ -0,0 +1,10 @@
+"""
+Gunicorn hooks for run.sh; gunicorn loads this file automatically.
+"""
+
+
+def when_ready(server):
+    # With --preload this runs in the master before workers are forked, so
+    # the parsed data and rendered page are built once and shared
+    from view import warm_cache
+    warm_cache()
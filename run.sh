@@ -0,0 +1,9 @@
+#!/bin/bash
+
+# Serve the viewer with gunicorn: 4 worker processes x 4 threads.
+# --preload imports the app (and warms its caches, see gunicorn.conf.py)
+# once in the master, so workers share the parsed data copy-on-write.
+# For local development, `python view.py` still runs Flask's dev server.
+PORT=${PORT:-5011}
+
+exec gunicorn view:app -w 4 -k gthread --threads 4 -b 0.0.0.0:$PORT --preload
@@ -7,6 +7,11 @@ from crawler import RecursiveBlogDiscovery
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+def summarize(post):
+    """Return (has_full_content, has_raw_html, full_content_length) for a post"""
+    full_content = post.full_content or ''
+    return bool(full_content), bool(post.raw_html_content), len(full_content)
+
 def test_enhanced_crawler():
     print("\n" + "="*80)
     print("TESTING ENHANCED CRAWLER")
@@ -27,11 +32,11 @@ def test_enhanced_crawler():
     
     # Check if full content is saved
     for domain, info in results.items():
-        post = info.latest_post
+        has_full_content, has_raw_html, content_length = summarize(info.latest_post)
         print(f"\nBlog: {info.name}")
-        print(f"Has full_content: {bool(post.full_content)}")
-        print(f"Has raw_html: {bool(post.raw_html_content)}")
-        print(f"Full content length: {len(post.full_content or '')} chars")
+        print(f"Has full_content: {has_full_content}")
+        print(f"Has raw_html: {has_raw_html}")
+        print(f"Full content length: {content_length} chars")
         break  # Just show first one
     
     crawler.save_results('test_enhanced_results.json')
@@ -2,13 +2,13 @@
 """
 Simple test to check network viewer data
 """
-import json
 import os
+import orjson
 
 checkpoint_path = os.path.join('json', 'aggressive_checkpoint.json')
 if os.path.exists(checkpoint_path):
-    with open(checkpoint_path, 'r') as f:
-        data = json.load(f)
+    with open(checkpoint_path, 'rb') as f:
+        data = orjson.loads(f.read())
     
     blogs_dict = data['discovered_blogs']
     
@@ -0,0 +1,158 @@
+import gzip
+import os
+import brotli
+import orjson
+import pytest
+import view
+
+
+def make_blog(i, depth=0, source=None):
+    return {
+        'url': f'https://blog{i}.example.com/',
+        'name': f'Blog {i}',
+        'latest_post': {
+            'title': f'Post {i}',
+            'link': f'https://blog{i}.example.com/p/1',
+            'published': f'2024-01-{i + 1:02d}T00:00:00',
+            'summary': 'Notes on graphs'
+        },
+        'discovered_from': {'source_blog': source, 'source_blog_name': 'Source'} if source else None,
+        'depth': depth
+    }
+
+
+def old_graph(blogs_dict):
+    """The node/link construction the viewer used before the columnar format."""
+    nodes, links = [], []
+    for domain, info in blogs_dict.items():
+        is_seed = info.get('discovered_from') is None
+        depth = info.get('depth', 0)
+        if is_seed or depth == 0:
+            node_type = 'seed'
+        elif depth == 1:
+            node_type = 'depth-1'
+        elif depth == 2:
+            node_type = 'depth-2'
+        elif depth == 3:
+            node_type = 'depth-3'
+        else:
+            node_type = 'depth-4plus'
+        nodes.append({'id': domain, 'type': node_type})
+    for domain, info in blogs_dict.items():
+        if info.get('discovered_from'):
+            source_url = info['discovered_from'].get('source_blog')
+            if source_url:
+                source_domain = next((d for d, i in blogs_dict.items() if i['url'] == source_url), None)
+                if source_domain:
+                    links.append({'source': source_domain, 'target': domain})
+    return nodes, links
+
+
+class TestView:
+
+    @pytest.fixture
+    def client(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(view.settings, 'JSON_DIR', str(tmp_path))
+        return view.app.test_client()
+
+    def write_checkpoint(self, tmp_path, blogs_dict, mtime_ns=None):
+        path = tmp_path / view.settings.CHECKPOINT_FILENAME
+        path.write_bytes(orjson.dumps({'discovered_blogs': blogs_dict}))
+        if mtime_ns is not None:
+            os.utime(path, ns=(mtime_ns, mtime_ns))
+        return path
+
+    def test_rebuilds_when_file_changes(self, tmp_path, client):
+        self.write_checkpoint(tmp_path, {'blog0.example.com': make_blog(0)}, mtime_ns=1_000_000_000)
+        first = client.get('/data.json')
+        assert orjson.loads(first.data)['ids'] == ['blog0.example.com']
+
+        self.write_checkpoint(tmp_path, {'blog1.example.com': make_blog(1)}, mtime_ns=2_000_000_000)
+        second = client.get('/data.json')
+        assert orjson.loads(second.data)['ids'] == ['blog1.example.com']
+        assert second.headers['ETag'] != first.headers['ETag']
+        assert b'Blog 1' in client.get('/').data
+
+    def write_graph(self, tmp_path):
+        blogs = {
+            'blog0.example.com': make_blog(0),
+            'blog1.example.com': make_blog(1, 1, 'https://blog0.example.com/'),
+            'blog2.example.com': make_blog(2, 2, 'https://blog1.example.com/'),
+            'blog3.example.com': make_blog(3, 3, 'https://blog2.example.com/'),
+            'blog4.example.com': make_blog(4, 6, 'https://blog3.example.com/'),
+            # Source not in the crawl, so no link
+            'blog5.example.com': make_blog(5, 1, 'https://elsewhere.example.com/'),
+            # Depth 0 with a source still counts as a seed
+            'blog6.example.com': make_blog(6, 0, 'https://blog0.example.com/'),
+        }
+        self.write_checkpoint(tmp_path, blogs)
+        return blogs
+
+    def test_links_match_old_construction(self, tmp_path, client):
+        nodes, links = old_graph(self.write_graph(tmp_path))
+        graph = orjson.loads(client.get('/data.json').data)
+
+        assert graph['ids'] == [n['id'] for n in nodes]
+        flat = graph['links_flat']
+        assert [(graph['ids'][s], graph['ids'][t]) for s, t in zip(flat[::2], flat[1::2])] == \
+            [(link['source'], link['target']) for link in links]
+
+    def test_cache_headers_skip_errors(self, tmp_path, client):
+        self.write_checkpoint(tmp_path, {'blog0.example.com': make_blog(0)})
+        assert client.get('/').headers['Cache-Control'] == 'public, max-age=60'
+        assert 'Cache-Control' not in client.get('/missing').headers
+
+    def test_type_codes_match_old_types(self, tmp_path, client):
+        nodes, _ = old_graph(self.write_graph(tmp_path))
+        graph = orjson.loads(client.get('/data.json').data)
+
+        codes = {'seed': 0, 'depth-1': 1, 'depth-2': 2, 'depth-3': 3, 'depth-4plus': 4}
+        assert graph['types'] == [codes[n['type']] for n in nodes]
+
+    @pytest.mark.parametrize('accept_encoding, content_encoding', [
+        ('', None), ('gzip', 'gzip'), ('gzip, deflate, br', 'br')
+    ])
+    def test_if_none_match_returns_304(self, tmp_path, client, accept_encoding, content_encoding):
+        self.write_checkpoint(tmp_path, {'blog0.example.com': make_blog(0)})
+        headers = {'Accept-Encoding': accept_encoding}
+        for url in ('/', '/data.json'):
+            response = client.get(url, headers=headers)
+            assert response.status_code == 200
+            assert response.headers.get('Content-Encoding') == content_encoding
+            assert 'Accept-Encoding' in response.headers['Vary']
+            revalidated = client.get(url, headers={**headers, 'If-None-Match': response.headers['ETag']})
+            assert revalidated.status_code == 304
+            assert revalidated.data == b''
+
+    def test_encoded_bodies_match(self, tmp_path, client):
+        self.write_checkpoint(tmp_path, {'blog0.example.com': make_blog(0)})
+        identity = client.get('/', headers={'Accept-Encoding': ''})
+        br = client.get('/', headers={'Accept-Encoding': 'br'})
+        gz = client.get('/', headers={'Accept-Encoding': 'gzip'})
+        assert brotli.decompress(br.data) == identity.data
+        assert gzip.decompress(gz.data) == identity.data
+        assert len({identity.headers['ETag'], br.headers['ETag'], gz.headers['ETag']}) == 3
+
+    def test_file_missing_at_open_returns_empty_data(self, tmp_path, client, monkeypatch):
+        path = self.write_checkpoint(tmp_path, {'blog0.example.com': make_blog(0)})
+        version = view._data_version()
+        # Archived between the stat and the open
+        path.unlink()
+        monkeypatch.setattr(view, '_data_version', lambda: version)
+
+        response = client.get('/data.json')
+        assert response.status_code == 200
+        assert orjson.loads(response.data)['ids'] == []
+        assert client.get('/').status_code == 200
+        assert view._build_data(version)['total_blogs'] == 0
+
+    def test_search_index_is_fetched_as_pairs(self, tmp_path, client):
+        blog = make_blog(0)
+        blog['name'] = 'The __proto__ blog'
+        self.write_checkpoint(tmp_path, {'blog0.example.com': blog, 'blog1.example.com': make_blog(1)})
+
+        index = dict(orjson.loads(client.get('/search.json').data))
+        # Cards are in newest-first page order
+        assert index['__proto__'] == [1]
+        assert index['graphs'] == [0, 1]
+        assert b'__proto__' not in client.get('/').data.split(b'<script>', 1)[1]
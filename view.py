@@ -3,16 +3,39 @@
 Combined Blog Discovery Viewer - Posts + Network in One App
 """
 
-from flask import Flask, render_template_string
-import json
+from flask import Flask, Response, request
+from flask_compress import Compress
+from markupsafe import Markup
 import os
+import re
+import math
+import orjson
 import argparse
+import threading
+import zlib
+import gzip
+import brotli
+from functools import wraps
+from operator import itemgetter
+import numpy as np
+import scipy.sparse
+from fa2_modified import ForceAtlas2
 from config import Settings
 
 # Initialize settings
 settings = Settings()
 
 app = Flask(__name__)
+# Brotli (or gzip) for HTML/JSON; tiny responses aren't worth the overhead.
+# The page and data.json are pre-compressed once per data version instead
+# (see _encoded), and flask-compress leaves responses that carry a
+# Content-Encoding alone.
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_MIN_SIZE'] = 500
+Compress(app)
+# Drop the whitespace left behind by {% %} lines; must be set before compiling
+app.jinja_env.trim_blocks = True
+app.jinja_env.lstrip_blocks = True
 
 COMBINED_TEMPLATE = '''
 <!DOCTYPE html>
@@ -22,275 +45,13 @@ COMBINED_TEMPLATE = '''
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>The Discovery Engine</title>
     <link href="https://fonts.googleapis.com/css2?family=Playfair+Display:wght@400;700;900&family=Libre+Franklin:wght@300;400;500;700&display=swap" rel="stylesheet">
-    <script src="https://d3js.org/d3.v7.min.js"></script>
+    {% if standalone %}
     <style>
-        :root {
-            --bg: #ffffff;
-            --text: #121212;
-            --text-secondary: #5a5a5a;
-            --border: #e2e2e2;
-            --accent: #000000;
-            --link: #326891;
-        }
-        
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        
-        body {
-            font-family: 'Georgia', 'Times New Roman', serif;
-            background: var(--bg);
-            color: var(--text);
-            line-height: 1.5;
-            -webkit-font-smoothing: antialiased;
-        }
-        
-        /* Header / Masthead */
-        header {
-            border-bottom: 1px solid #000;
-            padding: 20px 0;
-            margin-bottom: 40px;
-            text-align: center;
-            position: relative;
-        }
-        
-        .masthead-top {
-            border-bottom: 1px solid #e2e2e2;
-            padding: 0 20px 10px;
-            margin-bottom: 15px;
-            display: flex;
-            justify-content: space-between;
-            font-family: 'Libre Franklin', sans-serif;
-            font-size: 0.75rem;
-            text-transform: uppercase;
-            letter-spacing: 0.05em;
-            color: #333;
-            max-width: 1200px;
-            margin-left: auto;
-            margin-right: auto;
-        }
-
-        .logo {
-            font-family: 'Playfair Display', serif;
-            font-size: 3.5rem;
-            font-weight: 900;
-            letter-spacing: -1px;
-            color: #000;
-            margin: 10px 0;
-            line-height: 1;
-        }
-        
-        .logo-sub {
-            font-family: 'Libre Franklin', sans-serif;
-            font-size: 0.8rem;
-            text-transform: uppercase;
-            letter-spacing: 2px;
-            margin-top: 5px;
-            color: #666;
-        }
-
-        /* Navigation */
-        nav {
-            border-top: 1px solid #000;
-            border-bottom: 1px solid #000;
-            padding: 12px 0;
-            margin-top: 20px;
-            position: sticky;
-            top: 0;
-            background: white;
-            z-index: 100;
-        }
-        
-        .nav-container {
-            max-width: 1200px;
-            margin: 0 auto;
-            display: flex;
-            justify-content: center;
-            gap: 40px;
-        }
-        
-        .nav-link {
-            font-family: 'Libre Franklin', sans-serif;
-            font-size: 0.85rem;
-            font-weight: 700;
-            text-transform: uppercase;
-            color: #000;
-            cursor: pointer;
-            padding: 5px 0;
-            border-bottom: 2px solid transparent;
-            transition: border-color 0.2s;
-        }
-        
-        .nav-link:hover, .nav-link.active {
-            border-bottom-color: #000;
-        }
-
-        /* Content Layout */
-        .container {
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 0 20px 60px;
-        }
-        
-        .view { display: none; }
-        .view.active { display: block; }
-
-        /* Search Bar */
-        .search-container {
-            margin: 0 auto 40px;
-            max-width: 400px;
-            text-align: center;
-        }
-        
-        .search-box {
-            width: 100%;
-            padding: 10px 15px;
-            font-family: 'Libre Franklin', sans-serif;
-            font-size: 0.9rem;
-            border: 1px solid #ccc;
-            border-radius: 3px;
-            background: #f9f9f9;
-        }
-        
-        .search-box:focus {
-            outline: none;
-            background: #fff;
-            border-color: #000;
-        }
-
-        /* Blog Grid */
-        .blog-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
-            gap: 40px;
-            border-top: 1px solid #000;
-            padding-top: 40px;
-        }
-        
-        .blog-card {
-            padding-bottom: 20px;
-            border-bottom: 1px solid #e2e2e2;
-        }
-        
-        .blog-meta-top {
-            font-family: 'Libre Franklin', sans-serif;
-            font-size: 0.7rem;
-            font-weight: 700;
-            text-transform: uppercase;
-            color: #888;
-            margin-bottom: 8px;
-            letter-spacing: 0.5px;
-        }
-        
-        .blog-name {
-            color: #000;
-        }
-
-        .post-title {
-            font-family: 'Playfair Display', serif;
-            font-size: 1.5rem;
-            font-weight: 700;
-            line-height: 1.2;
-            margin-bottom: 12px;
-        }
-        
-        .post-title a {
-            color: #000;
-            text-decoration: none;
-            transition: color 0.2s;
-        }
-        
-        .post-title a:hover {
-            color: #555;
-        }
-        
-        .post-summary {
-            font-family: 'Georgia', serif;
-            font-size: 1rem;
-            color: #333;
-            line-height: 1.6;
-            margin-bottom: 15px;
-        }
-        
-        .post-meta-bottom {
-            font-family: 'Libre Franklin', sans-serif;
-            font-size: 0.75rem;
-            color: #888;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }
-        
-        .blog-link {
-            color: #326891;
-            text-decoration: none;
-            font-weight: 500;
-        }
-        
-        .blog-link:hover {
-            text-decoration: underline;
-        }
-
-        /* Network View */
-        #network-view {
-            height: 80vh;
-            border: 1px solid #e2e2e2;
-            background: #fcfcfc;
-            position: relative;
-        }
-        
-        .network-controls {
-            position: absolute;
-            bottom: 20px;
-            right: 20px;
-        }
-        
-        .btn {
-            background: #fff;
-            border: 1px solid #000;
-            color: #000;
-            padding: 8px 16px;
-            font-family: 'Libre Franklin', sans-serif;
-            font-weight: 600;
-            text-transform: uppercase;
-            font-size: 0.75rem;
-            cursor: pointer;
-            letter-spacing: 1px;
-        }
-        
-        .btn:hover {
-            background: #000;
-            color: #fff;
-        }
-
-        .legend {
-            position: absolute;
-            top: 20px;
-            right: 20px;
-            background: rgba(255,255,255,0.9);
-            padding: 15px;
-            border: 1px solid #ccc;
-            font-family: 'Libre Franklin', sans-serif;
-            font-size: 0.8rem;
-        }
-
-        /* Tooltip */
-        .tooltip {
-            position: absolute;
-            background: #fff;
-            border: 1px solid #000;
-            padding: 10px;
-            font-family: 'Libre Franklin', sans-serif;
-            font-size: 0.8rem;
-            pointer-events: none;
-            display: none;
-            box-shadow: 4px 4px 0px rgba(0,0,0,0.1);
-        }
-
-        /* D3 Styles */
-        .node { stroke: #fff; stroke-width: 2px; filter: drop-shadow(0px 1px 2px rgba(0,0,0,0.1)); transition: all 0.3s; }
-        .node:hover { stroke: #000; stroke-width: 2px; filter: drop-shadow(0px 4px 6px rgba(0,0,0,0.2)); }
-        .link { stroke: #cbd5e1; stroke-width: 1px; opacity: 0.6; }
-
+{{ css }}
     </style>
+    {% else %}
+    <link rel="stylesheet" href="{{ css_url }}">
+    {% endif %}
 </head>
 <body>
     <header>
@@ -317,8 +78,8 @@ COMBINED_TEMPLATE = '''
             </div>
             
             <div class="blog-grid" id="blogGrid">
-                {% for blog in blogs %}
-                <div class="blog-card" data-search="{{ (blog.name + ' ' + blog.latest_post.title + ' ' + blog.latest_post.summary)|lower }}">
+                {% for blog in blogs[:page_size] %}
+                <div class="blog-card" data-search="{{ blog.search_text }}">
                     <div class="blog-meta-top">
                         <span class="blog-name">{{ blog.name }}</span>
                     </div>
@@ -326,20 +87,21 @@ COMBINED_TEMPLATE = '''
                         <a href="{{ blog.latest_post.link }}" target="_blank">{{ blog.latest_post.title }}</a>
                     </div>
                     <div class="post-summary">
-                        {{ blog.latest_post.summary[:250] }}{% if blog.latest_post.summary|length > 250 %}...{% endif %}
+                        {{ blog.summary_display }}
                     </div>
                     <div class="post-meta-bottom">
-                        <span>{{ blog.latest_post.published[:10] if blog.latest_post.published else 'Unknown Date' }}</span>
+                        <span>{{ blog.published_short }}</span>
                         <a href="{{ blog.url }}" target="_blank" class="blog-link">Visit Site &rarr;</a>
                     </div>
                 </div>
                 {% endfor %}
             </div>
+            <div id="gridSentinel"></div>
         </div>
 
         <!-- Network View -->
         <div id="network-view" class="view">
-            <svg id="graph"></svg>
+            <div id="graph"></div>
             <div class="legend">
                 <strong>Discovery Depth</strong><br><br>
                 <span style="color:#4f46e5">●</span> Seed Blog<br>
@@ -356,9 +118,84 @@ COMBINED_TEMPLATE = '''
     </div>
 
     <script>
-        const graphData = {{ graph_data|tojson }};
         let network = null;
         
+        // Graph data is fetched with the libraries when the map is first opened,
+        // so it doesn't weigh on the posts page. The static export has no server
+        // behind it and inlines the data instead.
+        function loadGraphData() {
+            {% if standalone %}
+            return Promise.resolve({{ graph_data_json }});
+            {% else %}
+            return fetch('data.json').then(response => response.json());
+            {% endif %}
+        }
+        
+        // Force layout worker: owns the simulation and posts node positions each tick
+        // as a transferable Float32Array [x0, y0, x1, y1, ...]
+        const SIM_WORKER_SRC = `
+            importScripts(
+                'https://cdn.jsdelivr.net/npm/d3-dispatch@3/dist/d3-dispatch.min.js',
+                'https://cdn.jsdelivr.net/npm/d3-quadtree@3/dist/d3-quadtree.min.js',
+                'https://cdn.jsdelivr.net/npm/d3-timer@3/dist/d3-timer.min.js',
+                'https://cdn.jsdelivr.net/npm/d3-force@3/dist/d3-force.min.js'
+            );
+            let nodes, simulation;
+            // Position buffers handed back by the main thread, reused instead of
+            // allocating a fresh one per tick
+            const spare = [];
+            
+            function postPositions() {
+                const xy = spare.pop() || new Float32Array(nodes.length * 2);
+                nodes.forEach((d, i) => {
+                    xy[i * 2] = d.x;
+                    xy[i * 2 + 1] = d.y;
+                });
+                self.postMessage({ positions: xy }, [xy.buffer]);
+            }
+            
+            self.onmessage = ({ data }) => {
+                if (data.type === 'recycle') {
+                    spare.push(data.positions);
+                    return;
+                }
+                if (data.type === 'init') {
+                    nodes = data.nodes;
+                    // The server ships a finished layout centred on 0; move it to the view centre
+                    nodes.forEach(d => {
+                        d.x += data.width / 2;
+                        d.y += data.height / 2;
+                    });
+                    // Links arrive as flat node index pairs, so forceLink needs no id lookup
+                    const links = [];
+                    for (let i = 0; i < data.links.length; i += 2) {
+                        links.push({ source: data.links[i], target: data.links[i + 1] });
+                    }
+                    // The simulation only runs while a node is dragged. Fast cooling plus a
+                    // coarser, range-capped Barnes-Hut charge keep those bursts short, and
+                    // it stops by itself once alpha falls back below alphaMin.
+                    simulation = d3.forceSimulation(nodes)
+                        .force('link', d3.forceLink(links).distance(100))
+                        .force('charge', d3.forceManyBody().strength(-200).theta(1.2).distanceMax(400))
+                        .force('center', d3.forceCenter(data.width / 2, data.height / 2))
+                        .alphaMin(0.005)
+                        .alphaDecay(0.05)
+                        .velocityDecay(0.6)
+                        .alpha(0)
+                        .on('tick', postPositions)
+                        .stop();
+                    postPositions();
+                    return;
+                }
+                // Drag events from the main thread pin/unpin a node
+                const d = nodes[data.index];
+                if (data.type === 'start' && !data.active) simulation.alphaTarget(0.3).restart();
+                if (data.type === 'end' && !data.active) simulation.alphaTarget(0);
+                d.fx = data.fx;
+                d.fy = data.fy;
+            };
+        `;
+        
         function showView(view) {
             document.querySelectorAll('.view').forEach(v => v.classList.remove('active'));
             document.querySelectorAll('.nav-link').forEach(l => l.classList.remove('active'));
@@ -367,79 +204,372 @@ COMBINED_TEMPLATE = '''
             event.target.classList.add('active');
             
             if (view === 'network' && !network) {
-                initNetwork();
+                network = initNetwork();
             }
         }
         
-        function initNetwork() {
+        async function initNetwork() {
+            // d3 and three.js are only needed here, so they are fetched the first
+            // time the map is opened rather than blocking the posts view
+            const [d3, THREE, graphData] = await Promise.all([
+                import('https://cdn.jsdelivr.net/npm/d3@7/+esm'),
+                import('https://cdn.jsdelivr.net/npm/three@0.149.0/build/three.module.js'),
+                loadGraphData()
+            ]);
             const container = document.getElementById('network-view');
-            const width = container.clientWidth;
-            const height = container.clientHeight;
-            
-            const svg = d3.select("#graph").attr("width", width).attr("height", height);
-            const g = svg.append("g");
+            // Size and pixel ratio are re-read on resize (including moving between screens)
+            let width = container.clientWidth;
+            let height = container.clientHeight;
+            let dpr = window.devicePixelRatio || 1;
+            const { ids, names, urls, types, depths, xs, ys } = graphData;
+            const nodes = ids.map((id, i) => ({
+                id, name: names[i], url: urls[i], type: types[i], depth: depths[i], x: xs[i], y: ys[i]
+            }));
+            // Links as node index pairs, shared by the worker and the render loop
+            const linkBuf = new Uint32Array(graphData.links_flat);
+            const linkCount = linkBuf.length / 2;
             
-            const zoom = d3.zoom().scaleExtent([0.1, 10]).on("zoom", e => g.attr("transform", e.transform));
-            svg.call(zoom);
+            // WebGL: all nodes are one THREE.Points and all links one THREE.LineSegments,
+            // so a frame is two draw calls regardless of graph size
+            const renderer = new THREE.WebGLRenderer({ antialias: true, alpha: true });
+            const canvas = renderer.domElement;
+            const graphEl = document.getElementById('graph');
+            graphEl.appendChild(canvas);
             
-            const simulation = d3.forceSimulation(graphData.nodes)
-                .force("link", d3.forceLink(graphData.links).id(d => d.id).distance(100))
-                .force("charge", d3.forceManyBody().strength(-200))
-                .force("center", d3.forceCenter(width/2, height/2));
+            // Labels are plain text on a 2D overlay; three.js has no cheap text primitive
+            const labelCanvas = document.createElement('canvas');
+            labelCanvas.className = 'graph-labels';
+            graphEl.appendChild(labelCanvas);
+            const labelCtx = labelCanvas.getContext('2d');
             
-            const link = g.append("g").selectAll("line").data(graphData.links).join("line").attr("class", "link");
+            // Orthographic camera in d3 pixel space (y down), panned/zoomed by d3.zoom
+            const scene = new THREE.Scene();
+            const camera = new THREE.OrthographicCamera(0, width, 0, height, -1, 1);
             
             // Vibrant palette for network
-            const getColor = (type) => {
-                if (type === 'seed') return '#4f46e5';      // Indigo
-                if (type === 'depth-1') return '#059669';   // Emerald
-                if (type === 'depth-2') return '#d97706';   // Amber
-                if (type === 'depth-3') return '#db2777';   // Pink
-                return '#475569';                           // Slate
+            // Indexed by node type code: 0 = seed, 1..3 = depth, 4 = depth 4+
+            const COLORS = [
+                0x4f46e5,   // Indigo
+                0x059669,   // Emerald
+                0xd97706,   // Amber
+                0xdb2777,   // Pink
+                0x475569    // Slate
+            ];
+            const radius = d => d.type === 0 ? 8 : (6 - Math.min(d.depth, 3));
+            
+            const positions = new Float32Array(nodes.length * 3);
+            const colors = new Float32Array(nodes.length * 3);
+            const radii = new Float32Array(nodes.length);
+            const color = new THREE.Color();
+            nodes.forEach((d, i) => {
+                color.setHex(COLORS[d.type]);
+                color.toArray(colors, i * 3);
+                radii[i] = radius(d);
+            });
+            
+            const nodeGeom = new THREE.BufferGeometry();
+            nodeGeom.setAttribute('position', new THREE.BufferAttribute(positions, 3));
+            nodeGeom.setAttribute('nodeColor', new THREE.BufferAttribute(colors, 3));
+            nodeGeom.setAttribute('radius', new THREE.BufferAttribute(radii, 1));
+            // Round points with a 2px white rim, sized in screen pixels like the old SVG circles
+            const nodeMaterial = new THREE.ShaderMaterial({
+                uniforms: { scale: { value: dpr } },
+                vertexShader: `
+                    attribute vec3 nodeColor;
+                    attribute float radius;
+                    uniform float scale;
+                    varying vec3 vColor;
+                    varying float vInner;
+                    void main() {
+                        vColor = nodeColor;
+                        vInner = (radius - 1.0) / (radius + 1.0);
+                        gl_PointSize = 2.0 * (radius + 1.0) * scale;
+                        gl_Position = projectionMatrix * modelViewMatrix * vec4(position, 1.0);
+                    }`,
+                fragmentShader: `
+                    varying vec3 vColor;
+                    varying float vInner;
+                    void main() {
+                        float d = length(gl_PointCoord - 0.5) * 2.0;
+                        if (d > 1.0) discard;
+                        gl_FragColor = vec4(d > vInner ? vec3(1.0) : vColor, 1.0);
+                    }`,
+                depthTest: false
+            });
+            const points = new THREE.Points(nodeGeom, nodeMaterial);
+            
+            const linkPositions = new Float32Array(linkCount * 6);
+            const linkGeom = new THREE.BufferGeometry();
+            linkGeom.setAttribute('position', new THREE.BufferAttribute(linkPositions, 3));
+            const lineSegments = new THREE.LineSegments(linkGeom, new THREE.LineBasicMaterial({
+                color: 0xcbd5e1, transparent: true, opacity: 0.6, depthTest: false
+            }));
+            
+            // Positions change every tick, so skip bounding-sphere culling
+            points.frustumCulled = false;
+            lineSegments.frustumCulled = false;
+            points.renderOrder = 1;
+            scene.add(lineSegments, points);
+            
+            const indexById = new Map(nodes.map((d, i) => [d.id, i]));
+            
+            // d3-force runs in a worker so drag relaxation never competes with pan/zoom/search
+            const simWorker = new Worker(URL.createObjectURL(new Blob([SIM_WORKER_SRC], { type: 'text/javascript' })));
+            simWorker.postMessage({
+                type: 'init', width, height,
+                nodes: nodes.map(d => ({ id: d.id, x: d.x, y: d.y })),
+                links: linkBuf
+            });
+            
+            let transform = d3.zoomIdentity;
+            
+            // Level of detail: labels are unreadable when zoomed out, so skip them
+            // entirely below this scale and otherwise only draw those in view.
+            const LABEL_MIN_ZOOM = 0.7;
+            
+            function drawLabels() {
+                labelCtx.setTransform(1, 0, 0, 1, 0, 0);
+                labelCtx.clearRect(0, 0, labelCanvas.width, labelCanvas.height);
+                if (transform.k < LABEL_MIN_ZOOM) return;
+                
+                const [x0, y0] = transform.invert([0, 0]);
+                const [x1, y1] = transform.invert([width, height]);
+                labelCtx.setTransform(dpr * transform.k, 0, 0, dpr * transform.k, dpr * transform.x, dpr * transform.y);
+                labelCtx.font = '12px Georgia, serif';
+                labelCtx.fillStyle = '#121212';
+                for (const d of nodes) {
+                    // Labels sit to the right of the node, so allow for their width
+                    if (d.x < x0 - 150 || d.x > x1 || d.y < y0 || d.y > y1 + 12) continue;
+                    labelCtx.fillText(d.name.length > 15 ? d.name.substring(0, 15) + '...' : d.name, d.x + 12, d.y + 4);
+                }
+            }
+            
+            // Coalesce tick/zoom updates into at most one WebGL render per frame
+            let frame = null;
+            function requestRender() {
+                if (frame !== null) return;
+                frame = requestAnimationFrame(() => {
+                    frame = null;
+                    renderer.render(scene, camera);
+                    drawLabels();
+                });
+            }
+            
+            let staleTicks = 0;
+            simWorker.onmessage = ({ data }) => {
+                staleTicks++;
+                const xy = data.positions;
+                nodes.forEach((d, i) => {
+                    d.x = positions[i * 3] = xy[i * 2];
+                    d.y = positions[i * 3 + 1] = xy[i * 2 + 1];
+                });
+                for (let i = 0; i < linkCount; i++) {
+                    const s = linkBuf[i * 2], t = linkBuf[i * 2 + 1];
+                    linkPositions[i * 6] = xy[s * 2];
+                    linkPositions[i * 6 + 1] = xy[s * 2 + 1];
+                    linkPositions[i * 6 + 3] = xy[t * 2];
+                    linkPositions[i * 6 + 4] = xy[t * 2 + 1];
+                }
+                nodeGeom.attributes.position.needsUpdate = true;
+                linkGeom.attributes.position.needsUpdate = true;
+                requestRender();
+                // Hand the buffer back so the worker can refill it next tick
+                simWorker.postMessage({ type: 'recycle', positions: xy }, [xy.buffer]);
             };
-
-            const node = g.append("g").selectAll("circle").data(graphData.nodes).join("circle")
-                .attr("class", "node")
-                .attr("r", d => d.type === 'seed' ? 8 : (6 - Math.min(d.depth, 3)))
-                .attr("fill", d => getColor(d.type))
-                .call(d3.drag()
-                    .on("start", (e,d) => { if (!e.active) simulation.alphaTarget(0.3).restart(); d.fx=d.x; d.fy=d.y; })
-                    .on("drag", (e,d) => { d.fx=e.x; d.fy=e.y; })
-                    .on("end", (e,d) => { if (!e.active) simulation.alphaTarget(0); d.fx=null; d.fy=null; }))
-                .on("click", (e, d) => window.open(d.url, '_blank'))
-                .on("mouseover", (e,d) => {
-                    const t = document.getElementById('tooltip');
-                    t.style.display = 'block';
-                    t.style.left = (e.pageX+10)+'px';
-                    t.style.top = (e.pageY+10)+'px';
-                    t.innerHTML = `<strong>${d.name}</strong><br>${d.url}`;
-                })
-                .on("mouseout", () => document.getElementById('tooltip').style.display = 'none');
             
-            // Add labels to nodes
-            const label = g.append("g").selectAll("text").data(graphData.nodes).join("text")
-                .attr("class", "label")
-                .text(d => d.name.length > 15 ? d.name.substring(0, 15) + '...' : d.name)
-                .attr("dx", 12)
-                .attr("dy", 4);
-
-            simulation.on("tick", () => {
-                link.attr("x1", d=>d.source.x).attr("y1", d=>d.source.y).attr("x2", d=>d.target.x).attr("y2", d=>d.target.y);
-                node.attr("cx", d=>d.x).attr("cy", d=>d.y);
-                label.attr("x", d=>d.x).attr("y", d=>d.y);
+            // Pan/zoom reprojects the camera; hit-testing inverts the same transform
+            function updateCamera() {
+                camera.left = -transform.x / transform.k;
+                camera.right = (width - transform.x) / transform.k;
+                camera.top = -transform.y / transform.k;
+                camera.bottom = (height - transform.y) / transform.k;
+                camera.updateProjectionMatrix();
+                nodeMaterial.uniforms.scale.value = dpr * transform.k;
+                requestRender();
+            }
+            const zoom = d3.zoom().scaleExtent([0.1, 10]).on("zoom", e => {
+                transform = e.transform;
+                updateCamera();
             });
             
-            window.resetNetworkView = function() {
-                svg.transition().duration(750).call(zoom.transform, d3.zoomIdentity);
+            // Both canvases track the container's CSS size at device resolution
+            function resize() {
+                width = container.clientWidth;
+                height = container.clientHeight;
+                dpr = window.devicePixelRatio || 1;
+                renderer.setPixelRatio(dpr);
+                renderer.setSize(width, height);
+                labelCanvas.width = width * dpr;
+                labelCanvas.height = height * dpr;
+                labelCanvas.style.width = width + 'px';
+                labelCanvas.style.height = height + 'px';
+                updateCamera();
+            }
+            resize();
+            new ResizeObserver(resize).observe(container);
+            // Nearest node within a 10px screen radius of the pointer, via a quadtree.
+            // It is rebuilt lazily: at most every 5th tick while a drag keeps the
+            // simulation running, otherwise whenever positions have changed.
+            let tree = null;
+            let dragging = false;
+            const nodeAt = (event) => {
+                if (!tree || staleTicks >= 5 || (staleTicks && !dragging)) {
+                    tree = d3.quadtree(nodes, d => d.x, d => d.y);
+                    staleTicks = 0;
+                }
+                const [x, y] = transform.invert(d3.pointer(event, canvas));
+                return tree.find(x, y, 10 / transform.k) || null;
             };
+            const pin = (e, fx, fy) => simWorker.postMessage({
+                type: e.type, index: indexById.get(e.subject.id), active: e.active, fx, fy
+            });
+            
+            const tooltip = document.getElementById('tooltip');
+            const drag = d3.drag()
+                .container(canvas)
+                .subject(e => nodeAt(e.sourceEvent))
+                .on("start", e => {
+                    dragging = true;
+                    pin(e, e.subject.x, e.subject.y);
+                })
+                .on("drag", e => pin(e, ...transform.invert(d3.pointer(e, canvas))))
+                .on("end", e => {
+                    dragging = false;
+                    pin(e, null, null);
+                });
+            
+            // Drag is registered first so it claims pointer-downs on nodes; empty space pans
+            d3.select(canvas)
+                .call(drag)
+                .call(zoom)
+                .on("click", e => {
+                    const d = nodeAt(e);
+                    if (d) window.open(d.url, '_blank');
+                })
+                .on("mousemove", e => {
+                    const d = nodeAt(e);
+                    canvas.style.cursor = d ? 'pointer' : 'default';
+                    if (!d) {
+                        tooltip.style.display = 'none';
+                        return;
+                    }
+                    tooltip.style.display = 'block';
+                    tooltip.style.left = (e.pageX+10)+'px';
+                    tooltip.style.top = (e.pageY+10)+'px';
+                    // Names and URLs come from crawled feeds, so they go in as text
+                    tooltip.replaceChildren(Object.assign(document.createElement('strong'), { textContent: d.name }),
+                                            document.createElement('br'), d.url);
+                })
+                .on("mouseout", () => tooltip.style.display = 'none');
             
-            network = true;
+            window.resetNetworkView = function() {
+                d3.select(canvas).transition().duration(750).call(zoom.transform, d3.zoomIdentity);
+            };
+        }
+        
+        // Only the first page of cards is in the HTML; the rest arrive as JSON
+        // and are turned into elements the first time they are scrolled to.
+        const PAGE_SIZE = {{ page_size }};
+        const grid = document.getElementById('blogGrid');
+        const cards = [
+            ...[...grid.querySelectorAll('.blog-card')].map(el => ({ el, terms: el.dataset.search })),
+            ...{{ blogs_json }}.map(data => ({ el: null, terms: data.search, data }))
+        ];
+        
+        function cardElement(card) {
+            if (card.el) return card.el;
+            const { name, url, title, link, summary, published } = card.data;
+            const el = document.createElement('div');
+            el.className = 'blog-card';
+            el.innerHTML = `
+                <div class="blog-meta-top"><span class="blog-name"></span></div>
+                <div class="post-title"><a target="_blank"></a></div>
+                <div class="post-summary"></div>
+                <div class="post-meta-bottom">
+                    <span></span>
+                    <a target="_blank" class="blog-link">Visit Site &rarr;</a>
+                </div>`;
+            el.querySelector('.blog-name').textContent = name;
+            const titleLink = el.querySelector('.post-title a');
+            titleLink.href = link;
+            titleLink.textContent = title;
+            el.querySelector('.post-summary').textContent = summary;
+            el.querySelector('.post-meta-bottom span').textContent = published;
+            el.querySelector('.blog-link').href = url;
+            return card.el = el;
+        }
+        
+        // Indices of the cards matching the current search, and how many are in the grid
+        let visible = cards.map((_, i) => i);
+        let shown = Math.min(PAGE_SIZE, cards.length);
+        
+        function showMore() {
+            const end = Math.min(shown + PAGE_SIZE, visible.length);
+            const fragment = document.createDocumentFragment();
+            for (; shown < end; shown++) fragment.appendChild(cardElement(cards[visible[shown]]));
+            grid.appendChild(fragment);
+        }
+        
+        new IntersectionObserver(entries => {
+            if (entries[0].isIntersecting && shown < visible.length) showMore();
+        }, { rootMargin: '800px' }).observe(document.getElementById('gridSentinel'));
+        
+        // Search index built by the server, as [word token, indices of the cards containing
+        // it] pairs. It is fetched on the first search, which scans the cards until it
+        // arrives. The static export has no server behind it and always scans.
+        let searchIndex = null;
+        let searchIndexRequested = false;
+        
+        function loadSearchIndex() {
+            {% if not standalone %}
+            if (searchIndexRequested) return;
+            searchIndexRequested = true;
+            fetch('search.json')
+                .then(response => response.json())
+                .then(index => { searchIndex = index; });
+            {% endif %}
+        }
+        
+        function candidatesFor(searchTerm) {
+            if (!searchIndex) return null;
+            // Each word of the query is a substring of some token of every matching
+            // card, so the vocabulary narrows the candidates. Words under 3 characters
+            // match most tokens and would cost more than scanning the cards, so they
+            // are left to the substring check. Longest word first, as it is usually
+            // the most selective.
+            const words = (searchTerm.match(/\\w+/g) || [])
+                .filter(word => word.length >= 3)
+                .sort((a, b) => b.length - a.length);
+            if (!words.length) return null;
+            let candidates = null;
+            for (const word of words) {
+                const ids = new Set();
+                for (const [token, postings] of searchIndex) {
+                    if (token.includes(word)) postings.forEach(i => ids.add(i));
+                }
+                candidates = candidates ? new Set([...candidates].filter(i => ids.has(i))) : ids;
+                if (!candidates.size) break;
+            }
+            return [...candidates].sort((a, b) => a - b);
+        }
+        
+        function filterCards(searchTerm) {
+            // Candidates are verified against the full text so matching stays a plain substring test
+            const candidates = candidatesFor(searchTerm) || cards.map((_, i) => i);
+            visible = candidates.filter(i => cards[i].terms.includes(searchTerm));
+            // Matches are paged in like the unfiltered list, starting from the top
+            grid.replaceChildren();
+            shown = 0;
+            showMore();
         }
         
+        let searchFrame = null;
         document.getElementById('searchInput').addEventListener('input', function() {
-            const searchTerm = this.value.toLowerCase();
-            document.querySelectorAll('.blog-card').forEach(card => {
-                card.style.display = card.getAttribute('data-search').includes(searchTerm) ? 'block' : 'none';
+            loadSearchIndex();
+            if (searchFrame !== null) cancelAnimationFrame(searchFrame);
+            searchFrame = requestAnimationFrame(() => {
+                searchFrame = null;
+                filterCards(this.value.toLowerCase());
             });
         });
     </script>
@@ -448,73 +578,345 @@ COMBINED_TEMPLATE = '''
 '''
 
 
+def _minify(source):
+    """Drop HTML comments, comment-only JS lines, indentation and blank lines.
+
+    Line breaks are kept, so removing whole // lines can't join statements;
+    JS/CSS is otherwise left untouched.
+    """
+    source = re.sub(r'<!--.*?-->', '', source, flags=re.S)
+    source = re.sub(r'^[ \t]+', '', source, flags=re.M)
+    source = re.sub(r'^//.*$', '', source, flags=re.M)
+    return re.sub(r'\n{2,}', '\n', source)
+
+
+# Compile once at import; render_template_string would re-lex/parse/codegen per request.
+# The readable source above is what's edited; the minified form is what's served.
+_TEMPLATE = app.jinja_env.from_string(_minify(COMBINED_TEMPLATE))
+
+# Page CSS lives in static/app.css. The link carries a content hash, so the file
+# can be cached for good; the static export inlines it instead.
+with open(os.path.join(app.static_folder, 'app.css'), encoding='utf-8') as _f:
+    _CSS = Markup(_f.read())
+_CSS_URL = f"{app.static_url_path}/app.css?v={zlib.crc32(_CSS.encode('utf-8')):x}"
+
+# Encodings the page and data.json are pre-compressed in, best first
+_ENCODINGS = ('br', 'gzip')
+
+# Cards rendered into the page; the rest are shipped as JSON and appended on scroll
+_PAGE_SIZE = 60
+
+_WORD_RE = re.compile(r'\w+')
+
+# Link rest length of the worker's d3-force simulation, which the server
+# layout is scaled to
+_LINK_DISTANCE = 100
+
+
 def load_data():
+    return _build_data(_data_version())
+
+
+def _cache_latest(func):
+    """Memoize func for the latest data version only.
+    
+    Older snapshots are dropped as soon as the files change instead of being
+    kept alive by an LRU, and the lock makes concurrent misses build once.
+    """
+    lock = threading.Lock()
+    cache = {}
+    
+    @wraps(func)
+    def wrapper(version):
+        with lock:
+            if version not in cache:
+                cache.clear()
+                cache[version] = func(version)
+            return cache[version]
+    return wrapper
+
+
+def _data_version():
+    """Identify the JSON source in use as (path, is_checkpoint, mtime_ns, size), or None.
+
+    Derived data is cached per version, so a rewrite by the crawler invalidates it.
+    """
     checkpoint_path = os.path.join(settings.JSON_DIR, settings.CHECKPOINT_FILENAME)
     results_path = os.path.join(settings.JSON_DIR, 'discovery_results.json')
     
-    if os.path.exists(checkpoint_path):
-        with open(checkpoint_path, 'r') as f:
-            data = json.load(f)
-            # If checkpoint exists, we assume it's the primary source for current state
-            # and return the count of discovered blogs.
-            # The rest of the function expects a full data structure, so this path
-            # needs to be handled carefully if the UI expects more than just a count.
-            # For now, we'll return a dummy full structure if only count is needed.
-            # If the UI needs full data from checkpoint, this logic needs adjustment.
-            blogs_dict = data['discovered_blogs']
-    elif os.path.exists(results_path):
-        with open(results_path, 'r') as f:
-            data = json.load(f)
-        blogs_dict = {b['domain']: b for b in data.get('blogs', [])}
-    else:
-        return {'blogs': [], 'total_blogs': 0, 'graph_data': {'nodes': [], 'links': []}}
+    for path in (checkpoint_path, results_path):
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            continue
+        return (path, path == checkpoint_path, st.st_mtime_ns, st.st_size)
+    return None
+
+
+def _script_json(obj) -> Markup:
+    """Serialize obj for inlining in a <script> block, escaped like Jinja's |tojson."""
+    return Markup(orjson.dumps(obj).decode('utf-8')
+                  .replace('<', '\\u003c').replace('>', '\\u003e')
+                  .replace('&', '\\u0026').replace("'", '\\u0027'))
+
+
+def _empty_data():
+    return {
+        'blogs': [], 'total_blogs': 0, 'page_size': _PAGE_SIZE,
+        'blogs_json': _script_json([]),
+        'graph_data': {'ids': [], 'names': [], 'urls': [], 'types': [], 'depths': [], 'links_flat': []}
+    }
+
+
+@_cache_latest
+def _build_data(version):
+    """Parse the JSON source into posts + graph data; cached per _data_version()."""
+    if version is None:
+        return _empty_data()
     
-    # Posts data
-    blogs_list = [{'domain': domain, **info} for domain, info in blogs_dict.items()]
-    blogs_list.sort(key=lambda b: b['latest_post'].get('published', '') or '', reverse=True)
+    path, is_checkpoint, _, _ = version
+    try:
+        with open(path, 'rb') as f:
+            data = orjson.loads(f.read())
+    except FileNotFoundError:
+        # Moved away (e.g. archived) since it was stat'ed; the next request
+        # re-stats and picks up whatever source exists then
+        return _empty_data()
     
-    # Graph data
-    nodes, links = [], []
-    for domain, info in blogs_dict.items():
-        is_seed = info.get('discovered_from') is None
-        depth = info.get('depth', 0)
-        
-        # Determine node type based on depth
-        if is_seed or depth == 0:
-            node_type = 'seed'
-        elif depth == 1:
-            node_type = 'depth-1'
-        elif depth == 2:
-            node_type = 'depth-2'
-        elif depth == 3:
-            node_type = 'depth-3'
-        else:
-            node_type = 'depth-4plus'
+    if is_checkpoint:
+        # If checkpoint exists, we assume it's the primary source for current state
+        # and return the count of discovered blogs.
+        # The rest of the function expects a full data structure, so this path
+        # needs to be handled carefully if the UI expects more than just a count.
+        # For now, we'll return a dummy full structure if only count is needed.
+        # If the UI needs full data from checkpoint, this logic needs adjustment.
+        blog_items = data['discovered_blogs'].items()
+    else:
+        # The results file is already a list with one entry per domain (it is
+        # written from discovered_blogs), so iterate it as-is instead of re-keying
+        blog_items = ((b['domain'], b) for b in data.get('blogs', []))
+    
+    # A single pass over the blogs builds the posts list and the graph's
+    # parallel (SoA) columns, which are shipped to the client as they are
+    sortable, domains, names, urls, types, depths, source_urls = [], [], [], [], [], [], []
+    # URL -> node index for resolving links; the first blog with a given URL
+    # wins, as the old linear scan did
+    url_to_index = {}
+    for domain, info in blog_items:
+        # Posts data, keyed by publish date for the newest-first sort below, with
+        # display strings derived once per data version rather than per card render
+        post = info['latest_post']
+        summary = post.get('summary', '')
+        published = post.get('published') or ''
+        sortable.append((published, {
+            'domain': domain, **info,
+            'search_text': (info['name'] + ' ' + post.get('title', '') + ' ' + summary)[:2000].lower(),
+            'summary_display': summary[:250] + '...' if len(summary) > 250 else summary,
+            'published_short': published[:10] or 'Unknown Date'
+        }))
         
-        nodes.append({
-            'id': domain, 'name': info['name'], 'label': info['name'][:25],
-            'url': info['url'], 'type': node_type, 'depth': depth,
-            'source': info['discovered_from'].get('source_blog_name') if info.get('discovered_from') else None
-        })
+        df = info.get('discovered_from')
+        depth = info.get('depth', 0)
+        domains.append(domain)
+        names.append(info['name'])
+        url_to_index.setdefault(info['url'], len(urls))
+        urls.append(info['url'])
+        # Node type code: 0 for seeds (and depth 0), else the depth capped at 4;
+        # the client maps codes to colours
+        types.append(0 if df is None or depth == 0 else min(depth, 4))
+        depths.append(depth)
+        source_urls.append(df.get('source_blog') if df else None)
     
-    for domain, info in blogs_dict.items():
-        if info.get('discovered_from'):
-            source_url = info['discovered_from'].get('source_blog')
-            if source_url:
-                source_domain = next((d for d,i in blogs_dict.items() if i['url']==source_url), None)
-                if source_domain:
-                    links.append({'source': source_domain, 'target': domain})
+    # Links as flat [source, target, ...] node indices; the client reads them
+    # straight into a Uint32Array
+    links_flat = []
+    for target, source_url in enumerate(source_urls):
+        source = url_to_index.get(source_url)
+        if source is not None:
+            links_flat += (source, target)
     
+    sortable.sort(key=itemgetter(0), reverse=True)
+    blogs_list = [blog for _, blog in sortable]
+    
+    # Serialized here so it happens once per data change, not once per render.
+    # Nodes go out column-wise so no key is repeated per node; the layout is
+    # added by _graph_json(), which only the network view needs.
+    graph_data = {
+        'ids': domains, 'names': names, 'urls': urls, 'types': types, 'depths': depths,
+        'links_flat': links_flat
+    }
     return {
         'blogs': blogs_list,
         'total_blogs': len(blogs_list),
-        'graph_data': {'nodes': nodes, 'links': links}
+        'page_size': _PAGE_SIZE,
+        'blogs_json': _script_json([_card_fields(b) for b in blogs_list[_PAGE_SIZE:]]),
+        'graph_data': graph_data
+    }
+
+
+def _with_layout(graph_data):
+    """graph_data plus its xs/ys layout columns."""
+    xs, ys = _layout(len(graph_data['ids']), graph_data['links_flat'])
+    return {**graph_data, 'xs': xs, 'ys': ys}
+
+
+@_cache_latest
+def _graph_json(version):
+    """Serialize and encode the graph with its layout once per data version.
+
+    Cached apart from _build_data() so the page never waits on the layout.
+    """
+    return _encoded(orjson.dumps(_with_layout(_build_data(version)['graph_data'])))
+
+
+def _encoded(body):
+    """Map 'identity' and each of _ENCODINGS to (bytes, etag) for a response body.
+
+    Compressing here, once per data version, keeps requests (304s included)
+    from re-compressing the same bytes. Each ETag hashes the bytes sent, which
+    covers the data, the template and the code shaping it, so a deploy that
+    changes any of them never revalidates stale bytes.
+    """
+    variants = {
+        'identity': body,
+        # Quality 9 is within a few percent of 11 at a fraction of the time
+        'br': brotli.compress(body, quality=9),
+        'gzip': gzip.compress(body, compresslevel=9)
+    }
+    return {encoding: (data, f"{zlib.crc32(data):x}") for encoding, data in variants.items()}
+
+
+def _layout(count, links_flat):
+    """ForceAtlas2 x and y columns, centred on 0.
+
+    Barnes-Hut keeps each iteration O(n log n), so graphs of any size are laid
+    out here and never simulated in the browser. Scaled so links average the
+    worker's link distance; otherwise the first drag would stretch or shrink
+    the whole graph to fit its forces.
+    """
+    if not count:
+        return [], []
+    sources, targets = links_flat[::2], links_flat[1::2]
+    # Undirected adjacency; fa2 reads the upper triangle of a symmetric matrix
+    adjacency = scipy.sparse.coo_matrix(
+        (np.ones(len(links_flat)), (sources + targets, targets + sources)), shape=(count, count)
+    )
+    # Seeded start so the same data always produces the same picture
+    start = np.random.default_rng(42).random((count, 2))
+    forceatlas2 = ForceAtlas2(barnesHutOptimize=True, barnesHutTheta=1.2, verbose=False)
+    positions = np.array(forceatlas2.forceatlas2(adjacency, pos=start, iterations=100))
+    positions -= positions.mean(axis=0)
+    lengths = [math.dist(positions[s], positions[t]) for s, t in zip(sources, targets)]
+    mean = sum(lengths) / len(lengths) if lengths else 0
+    scale = _LINK_DISTANCE / mean if mean else max(200, 40 * count ** 0.5)
+    xs, ys = [], []
+    for x, y in positions:
+        xs.append(round(float(x) * scale, 1))
+        ys.append(round(float(y) * scale, 1))
+    return xs, ys
+
+
+def _search_index(blogs):
+    """[word token, indices (in page order) of the blogs whose search_text has it] pairs.
+
+    Pairs rather than an object, since a token such as __proto__ would not
+    survive as a key of a JS object.
+    """
+    index = {}
+    for i, blog in enumerate(blogs):
+        for token in dict.fromkeys(_WORD_RE.findall(blog['search_text'])):
+            index.setdefault(token, []).append(i)
+    return list(index.items())
+
+
+@_cache_latest
+def _search_json(version):
+    """Serialize and encode the search index once per data version; fetched on the first search."""
+    return _encoded(orjson.dumps(_search_index(_build_data(version)['blogs'])))
+
+
+def _card_fields(blog):
+    """Only what a post card displays, without full_content/raw_html_content."""
+    post = blog['latest_post']
+    return {
+        'name': blog['name'],
+        'url': blog['url'],
+        'title': post['title'],
+        'link': post['link'],
+        'summary': blog['summary_display'],
+        'published': blog['published_short'],
+        'search': blog['search_text']
     }
 
 
+def render_page(data, standalone=False):
+    """Render the viewer page; standalone inlines the CSS and graph data for a static copy."""
+    graph_data_json = _script_json(_with_layout(data['graph_data'])) if standalone else None
+    return _TEMPLATE.render(**data, standalone=standalone, css=_CSS, css_url=_CSS_URL,
+                            graph_data_json=graph_data_json)
+
+
+@_cache_latest
+def _render_index(version):
+    """Render and encode the full page once per data version."""
+    return _encoded(render_page(_build_data(version)).encode('utf-8'))
+
+
+@app.after_request
+def add_cache_headers(response):
+    # Errors (404s and the like) must not be cached by shared caches
+    if response.status_code not in (200, 304):
+        return response
+    if request.endpoint == 'static':
+        # Static URLs carry a content hash, so a given URL never changes
+        response.cache_control.public = True
+        response.cache_control.no_cache = None
+        response.cache_control.max_age = 31536000
+        response.cache_control.immutable = True
+    elif request.endpoint in ('index', 'data_json', 'search_json'):
+        # The data only changes when the crawler rewrites its JSON, so a short
+        # shared cache lifetime is safe; clients revalidate after that
+        response.cache_control.public = True
+        response.cache_control.max_age = 60
+    return response
+
+
+def warm_cache():
+    """Build the data, page, graph layout and search index for the current JSON before the first request."""
+    version = _data_version()
+    _render_index(version)
+    _graph_json(version)
+    _search_json(version)
+
+
+def _conditional(variants, mimetype):
+    """Respond with the best pre-encoded variant the client accepts, revalidating with its ETag."""
+    encoding = request.accept_encodings.best_match(_ENCODINGS, default='identity')
+    body, etag = variants[encoding]
+    response = Response(body, mimetype=mimetype)
+    if encoding != 'identity':
+        response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
+
 @app.route('/')
 def index():
-    return render_template_string(COMBINED_TEMPLATE, **load_data())
+    """The pre-rendered page; revalidates with its ETag."""
+    return _conditional(_render_index(_data_version()), 'text/html')
+
+
+@app.route('/data.json')
+def data_json():
+    """Graph data for the network view; revalidates with its ETag."""
+    return _conditional(_graph_json(_data_version()), 'application/json')
+
+
+@app.route('/search.json')
+def search_json():
+    """Search index for the posts view; revalidates with its ETag."""
+    return _conditional(_search_json(_data_version()), 'application/json')
 
 
 if __name__ == '__main__':
@@ -529,4 +931,4 @@ if __name__ == '__main__':
     data = load_data()
     print(f"\n{data['total_blogs']} blogs loaded")
     print(f"http://localhost:{args.port}\n")
-    app.run(debug=False, host='0.0.0.0', port=args.port)
+    app.run(debug=False, host='0.0.0.0', port=args.port, threaded=True)